@@ -8,12 +8,27 @@ common validation patterns like not_none, positive, in_range, etc.
 import re
 from enum import Enum
 from pathlib import Path
+from string import Formatter
 from typing import Any, Callable, Optional, Union
 from urllib.parse import urlparse
 
 from .messages import ErrorMessages
 from .types import GuardFunction
 
+# Public guard factories registered under the 'common' namespace. modgud/__init__.py re-exports
+# the same names as typed assignments - keep both lists in step
+COMMON_GUARD_NAMES = (
+  'not_empty',
+  'not_none',
+  'positive',
+  'in_range',
+  'type_check',
+  'matches_pattern',
+  'valid_file_path',
+  'valid_url',
+  'valid_enum',
+)
+
 
 class CommonGuards:
   """
@@ -82,13 +97,24 @@ class CommonGuards:
         GuardFunction that validates parameters
 
     """
+    # Templates that never mention {value} render the same on every failure - format once here
+    # Compare base names so attribute/index fields like {value.real} or {value[0]} count too
+    uses_value = any(
+      field is not None and field.partition('.')[0].partition('[')[0] == 'value'
+      for _, field, _, _ in Formatter().parse(error_template)
+    )
+    static_message = None if uses_value else error_template.format(param_name=param_name)
 
     def check(*args: Any, **kwargs: Any) -> Union[bool, str]:
       value = CommonGuards._extract_param(param_name, position, args, kwargs, default)
       # Single return point
       result: Union[bool, str] = True
       if not validator(value):
-        result = error_template.format(param_name=param_name, value=value)
+        result = (
+          static_message
+          if static_message is not None
+          else error_template.format(param_name=param_name, value=value)
+        )
       return result
 
     return check
@@ -431,20 +457,7 @@ class CommonGuards:
     """
     from .guard_registry import GuardRegistry
 
-    # List of guard methods to register (excluding private methods)
-    guards_to_register = [
-      'not_empty',
-      'not_none',
-      'positive',
-      'in_range',
-      'type_check',
-      'matches_pattern',
-      'valid_file_path',
-      'valid_url',
-      'valid_enum',
-    ]
-
-    for name in guards_to_register:
+    for name in COMMON_GUARD_NAMES:
       method = getattr(cls, name, None)
       if callable(method):
         GuardRegistry.register(name, method, namespace='common')
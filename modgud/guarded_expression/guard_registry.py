@@ -5,7 +5,7 @@ Allows external packages to register custom guard validators that can be
 accessed through the CommonGuards interface or separately.
 """
 
-from typing import Callable, Dict, Optional
+from typing import Callable, ClassVar, Dict, Optional, Tuple
 
 from .types import GuardFunction
 
@@ -28,7 +28,8 @@ class GuardRegistry:
       registry.register('another_guard', factory_fn)
   """
 
-  _instance: Optional['GuardRegistry'] = None
+  # Created once at import (see module bottom) - instance() needs no lazy-init check
+  _instance: ClassVar['GuardRegistry']
   _allow_direct_instantiation: bool = False
 
   def __init__(self) -> None:
@@ -38,13 +39,15 @@ class GuardRegistry:
     For production code, use GuardRegistry.instance() to get the singleton.
     Direct instantiation is allowed only for testing purposes.
     """
-    if not GuardRegistry._allow_direct_instantiation and GuardRegistry._instance is not None:
+    if not GuardRegistry._allow_direct_instantiation and hasattr(GuardRegistry, '_instance'):
       raise RuntimeError(
         'GuardRegistry is a singleton. Use GuardRegistry.instance() or '
         'GuardRegistry._create_for_testing() for tests.'
       )
-    self._guards: Dict[str, Callable[..., GuardFunction]] = {}
-    self._namespaces: Dict[str, Dict[str, Callable[..., GuardFunction]]] = {}
+    # Flat (namespace, name) keys - one hash lookup per access; None is the global namespace
+    self._guards: Dict[Tuple[Optional[str], str], Callable[..., GuardFunction]] = {}
+    # Guard count per namespace, in namespace creation order; emptied namespaces are removed
+    self._namespace_sizes: Dict[str, int] = {}
 
   @classmethod
   def _create_for_testing(cls) -> 'GuardRegistry':
@@ -71,10 +74,6 @@ class GuardRegistry:
         Global GuardRegistry singleton instance
 
     """
-    if cls._instance is None:
-      cls._instance = cls.__new__(cls)
-      cls._instance._guards = {}
-      cls._instance._namespaces = {}
     return cls._instance
 
   @classmethod
@@ -93,7 +92,7 @@ class GuardRegistry:
         GuardRegistry.register('valid_email', email_validator_factory)
 
     """
-    cls.instance()._register(name, guard_factory, namespace)
+    cls._instance._register(name, guard_factory, namespace)
 
   @classmethod
   def get(
@@ -110,7 +109,7 @@ class GuardRegistry:
         Guard factory function if found, None otherwise
 
     """
-    return cls.instance()._get(name, namespace)
+    return cls._instance._get(name, namespace)
 
   @classmethod
   def list_guards(cls, namespace: Optional[str] = None) -> list[str]:
@@ -124,7 +123,7 @@ class GuardRegistry:
         List of registered guard names
 
     """
-    return cls.instance()._list_guards(namespace)
+    return cls._instance._list_guards(namespace)
 
   @classmethod
   def list_namespaces(cls) -> list[str]:
@@ -135,7 +134,7 @@ class GuardRegistry:
         List of namespace names
 
     """
-    return cls.instance()._list_namespaces()
+    return cls._instance._list_namespaces()
 
   @classmethod
   def has_guard(cls, name: str, namespace: Optional[str] = None) -> bool:
@@ -150,7 +149,7 @@ class GuardRegistry:
         True if guard exists, False otherwise
 
     """
-    return cls.instance()._has_guard(name, namespace)
+    return cls._instance._has_guard(name, namespace)
 
   @classmethod
   def unregister(cls, name: str, namespace: Optional[str] = None) -> bool:
@@ -165,59 +164,54 @@ class GuardRegistry:
         True if guard was removed, False if not found
 
     """
-    return cls.instance()._unregister(name, namespace)
+    return cls._instance._unregister(name, namespace)
 
   # Instance methods (prefixed with _ to indicate they're called via class methods)
   def _register(
     self, name: str, guard_factory: Callable[..., GuardFunction], namespace: Optional[str] = None
   ) -> None:
     """Instance method for registration logic."""
-    if namespace is None:
-      if name in self._guards:
-        raise ValueError(f"Guard '{name}' is already registered in global namespace")
-      self._guards[name] = guard_factory
-    else:
-      if namespace not in self._namespaces:
-        self._namespaces[namespace] = {}
-      if name in self._namespaces[namespace]:
-        raise ValueError(f"Guard '{name}' is already registered in namespace '{namespace}'")
-      self._namespaces[namespace][name] = guard_factory
+    key = (namespace, name)
+    if key in self._guards:
+      raise ValueError(
+        f"Guard '{name}' is already registered in global namespace"
+        if namespace is None
+        else f"Guard '{name}' is already registered in namespace '{namespace}'"
+      )
+    self._guards[key] = guard_factory
+    if namespace is not None:
+      self._namespace_sizes[namespace] = self._namespace_sizes.get(namespace, 0) + 1
 
   def _get(
     self, name: str, namespace: Optional[str] = None
   ) -> Optional[Callable[..., GuardFunction]]:
     """Instance method for retrieval logic."""
-    return (
-      self._guards.get(name) if namespace is None else self._namespaces.get(namespace, {}).get(name)
-    )
+    return self._guards.get((namespace, name))
 
   def _list_guards(self, namespace: Optional[str] = None) -> list[str]:
     """Instance method for listing guards."""
-    return (
-      list(self._guards.keys())
-      if namespace is None
-      else list(self._namespaces.get(namespace, {}).keys())
-    )
+    return [name for ns, name in self._guards if ns == namespace]
 
   def _list_namespaces(self) -> list[str]:
     """Instance method for listing namespaces."""
-    return list(self._namespaces.keys())
+    return list(self._namespace_sizes)
 
   def _has_guard(self, name: str, namespace: Optional[str] = None) -> bool:
     """Instance method for checking guard existence."""
-    return self._get(name, namespace) is not None
+    return (namespace, name) in self._guards
 
   def _unregister(self, name: str, namespace: Optional[str] = None) -> bool:
     """Instance method for unregistration logic."""
-    removed = False
-    if namespace is None:
-      if name in self._guards:
-        del self._guards[name]
-        removed = True
-    else:
-      if namespace in self._namespaces and name in self._namespaces[namespace]:
-        del self._namespaces[namespace][name]
-        if not self._namespaces[namespace]:
-          del self._namespaces[namespace]
-        removed = True
+    removed = self._guards.pop((namespace, name), None) is not None
+    if removed and namespace is not None:
+      remaining = self._namespace_sizes[namespace] - 1
+      # Namespaces exist only while they hold guards
+      if remaining:
+        self._namespace_sizes[namespace] = remaining
+      else:
+        del self._namespace_sizes[namespace]
     return removed
+
+
+# Build the singleton eagerly so class-level calls go straight to its storage
+GuardRegistry._instance = GuardRegistry()
@@ -1,77 +1,72 @@
 """
 Guard checking logic for runtime validation.
 
-Provides the GuardRuntime class that encapsulates guard evaluation and
-failure handling logic.
+Provides the GuardRuntime class that encapsulates guard failure handling
+logic. Guard evaluation itself is inlined into the guarded_expression wrappers.
 """
 
 import logging
-from typing import Any, Optional, Tuple
+from typing import Any, Tuple
 
-from .types import FailureBehavior, GuardFunction
+from .types import FailureBehavior, FailureHandler
 
 
 class GuardRuntime:
-  """Runtime guard checking and failure handling."""
+  """Runtime guard failure handling."""
 
   _logger: logging.Logger = logging.getLogger(__name__)
 
   @classmethod
-  def check_guards(
-    cls, guards: Tuple[GuardFunction, ...], args: Tuple[Any, ...], kwargs: dict[str, Any]
-  ) -> Optional[str]:
+  def make_failure_handler(
+    cls, on_error: FailureBehavior, func_name: str, log_enabled: bool
+  ) -> FailureHandler:
     """
-    Evaluate all guards sequentially.
+    Build a failure handler specialized for the on_error configuration.
+
+    Resolves the exception/callable/value dispatch once, at decoration time,
+    so the per-call failure path carries no type checks.
 
     Args:
-        guards: Tuple of guard functions to evaluate
-        args: Positional arguments passed to the decorated function
-        kwargs: Keyword arguments passed to the decorated function
+        on_error: The failure behavior configuration - exception classes raise,
+            callables transform, values pass through
+        func_name: Name of the decorated function (for logging)
+        log_enabled: Whether to log failures
 
     Returns:
-        None if all guards pass, or error message string if any guard fails
+        Handler invoked with (error_msg, args, kwargs) that either raises the
+        configured exception or returns the fallback value
 
     """
-    for guard in guards:
-      guard_result = guard(*args, **kwargs)
-      # Early exit on first failure - fail fast principle
-      if guard_result is not True:  # Must be exact True, not just truthy
-        return guard_result if isinstance(guard_result, str) else 'Guard clause failed'
-    return None
+    handler: FailureHandler
+    if isinstance(on_error, type) and issubclass(on_error, BaseException):
+      exception_cls = on_error
 
-  @classmethod
-  def handle_failure(
-    cls,
-    error_msg: str,
-    on_error: FailureBehavior,
-    func_name: str,
-    args: Tuple[Any, ...],
-    kwargs: dict[str, Any],
-    log_enabled: bool,
-  ) -> Tuple[Any, Optional[BaseException]]:
-    """
-    Handle guard failure based on on_error configuration.
+      def handler(error_msg: str, args: Tuple[Any, ...], kwargs: dict[str, Any]) -> Any:
+        raise exception_cls(error_msg)
 
-    Args:
-        error_msg: The error message from the failed guard
-        on_error: The failure behavior configuration
-        func_name: Name of the decorated function (for logging)
-        args: Positional arguments passed to the decorated function
-        kwargs: Keyword arguments passed to the decorated function
-        log_enabled: Whether to log the failure
+    elif callable(on_error):
+      # Callables get full context for recovery logic
+      recover = on_error
 
-    Returns:
-        Tuple of (return_value, exception_to_raise)
-        - If exception should be raised: (None, exception_instance)
-        - If value should be returned: (value, None)
+      def handler(error_msg: str, args: Tuple[Any, ...], kwargs: dict[str, Any]) -> Any:
+        return recover(error_msg, *args, **kwargs)  # type: ignore[call-arg]
 
-    """
-    # Log before handling - capture failure regardless of handler outcome
-    if log_enabled:
-      cls._logger.info(f'Guard clause failed in {func_name}: {error_msg}')
+    else:
+      fallback = on_error
 
-    # Exception classes raise, callables transform, values pass through
-    if isinstance(on_error, type) and issubclass(on_error, BaseException):
-      return (None, on_error(error_msg))
-    # Callables get full context for recovery logic, values are simple fallbacks
-    return (on_error(error_msg, *args, **kwargs) if callable(on_error) else on_error, None)  # type: ignore[call-arg]
+      def handler(error_msg: str, args: Tuple[Any, ...], kwargs: dict[str, Any]) -> Any:
+        return fallback
+
+    return cls._with_logging(handler, func_name) if log_enabled else handler
+
+  @classmethod
+  def _with_logging(cls, handler: FailureHandler, func_name: str) -> FailureHandler:
+    """Wrap handler so each failure is logged before it is handled."""
+    logger = cls._logger
+
+    def logging_handler(error_msg: str, args: Tuple[Any, ...], kwargs: dict[str, Any]) -> Any:
+      # Log before handling - capture failure regardless of handler outcome
+      logger.info(f'Guard clause failed in {func_name}: {error_msg}')
+      return handler(error_msg, args, kwargs)
+
+    return logging_handler
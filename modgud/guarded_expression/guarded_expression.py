@@ -11,11 +11,14 @@ of guard_clause and implicit_return into a single, composable decorator.
 import functools
 import inspect
 from textwrap import dedent
-from typing import Any, Callable, Optional
+from types import CodeType, FunctionType
+from typing import Any, Callable, ClassVar, Optional, Tuple
+from weakref import WeakKeyDictionary
 
 from .errors import GuardClauseError, UnsupportedConstructError
 from .guard_runtime import GuardRuntime
 from .implicit_return import ImplicitReturnTransformer
+from .messages import ErrorMessages
 from .types import FailureBehavior, GuardFunction
 
 
@@ -49,6 +52,11 @@ class guarded_expression:
 
   """
 
+  __slots__ = ('guards', 'implicit_return_enabled', 'on_error', 'log')
+
+  # Compiled implicit-return modules keyed by the original function's code object
+  _transform_cache: ClassVar[WeakKeyDictionary[CodeType, CodeType]] = WeakKeyDictionary()
+
   def __init__(
     self,
     *guards: GuardFunction,
@@ -82,29 +90,75 @@ class guarded_expression:
 
   def _apply_implicit_return(self, func: Callable[..., Any]) -> Callable[..., Any]:
     """Apply implicit return transformation to the function."""
-    # Extract and parse source
-    try:
-      source = dedent(inspect.getsource(func))
-    except OSError as e:
+    # getsource follows __wrapped__, so the rewrite is of the innermost function - take its
+    # code cache key, defaults and globals too. Wraps-style decorators share one wrapper code
+    # object across every function they decorate, and their wrappers carry no defaults
+    original = inspect.unwrap(func)
+    code = self._compile_implicit_return(original)
+
+    transformed: Callable[..., Any]
+    if code.co_name == original.__name__:
+      # Build straight from the function's code object - no exec or namespace round-trip.
+      # Reusing the original defaults keeps default objects identical to the undecorated def
+      transformed = FunctionType(
+        code, original.__globals__, original.__name__, original.__defaults__
+      )
+      transformed.__kwdefaults__ = original.__kwdefaults__
+    elif code.co_name == '<module>':
+      # Generic (PEP 695) defs nest their code in a type-parameter scope - run the module code
+      # against the live globals and collect the def from a throwaway locals dict
+      env: dict[str, Any] = {}
+      exec(code, original.__globals__, env)
+      transformed = env[original.__name__]  # Extract the redefined function
+    else:
       raise UnsupportedConstructError(
-        'Source unavailable — guarded_expression with implicit_return=True requires importable source code.'
-      ) from e
-
-    # Transform the AST
-    new_tree, filename = ImplicitReturnTransformer.apply_implicit_return_transform(
-      source, func.__name__
-    )
-
-    # Execute in copy of original scope - preserves imports/closures
-    env = func.__globals__.copy()
-    code = compile(new_tree, filename=filename, mode='exec')
-    exec(code, env)
-
-    transformed = env[func.__name__]  # Extract the redefined function
+        f"Compiled code for '{original.__name__}' has unexpected name '{code.co_name}'"
+      )
 
     # Wrap with guards and return
     return self._wrap_with_guards(transformed, preserve_metadata_from=func)
 
+  @classmethod
+  def _compile_implicit_return(cls, original: Callable[..., Any]) -> CodeType:
+    """Compile the implicit-return rewrite of an unwrapped function, reusing prior results."""
+    # Same code object means same source - skip getsource/parse/rewrite/compile on repeats
+    code = cls._transform_cache.get(original.__code__)
+    if code is None:
+      # Extract and parse source
+      try:
+        source = dedent(inspect.getsource(original))
+      except OSError as e:
+        raise UnsupportedConstructError(
+          'Source unavailable — guarded_expression with implicit_return=True requires importable source code.'
+        ) from e
+
+      code = cls._compile_source(source, original.__name__)
+      cls._transform_cache[original.__code__] = code
+    return code
+
+  @staticmethod
+  @functools.lru_cache(maxsize=256)
+  def _compile_source(source: str, func_name: str) -> CodeType:
+    """
+    Transform and compile function source, shared across code objects with identical source.
+
+    Returns the compiled function's own code object when it sits directly in the module
+    code, otherwise the module code itself (e.g. generic defs wrapped in a type-param scope).
+    """
+    # Reloaded modules produce new code objects for unchanged source - reuse the compile
+    new_tree, filename = ImplicitReturnTransformer.apply_implicit_return_transform(
+      source, func_name
+    )
+    module_code = compile(new_tree, filename=filename, mode='exec')
+    return next(
+      (
+        const
+        for const in module_code.co_consts
+        if isinstance(const, CodeType) and const.co_name == func_name
+      ),
+      module_code,
+    )
+
   def _wrap_with_guards(
     self, func: Callable[..., Any], preserve_metadata_from: Optional[Callable[..., Any]] = None
   ) -> Callable[..., Any]:
@@ -112,25 +166,82 @@ class guarded_expression:
     # Use original for metadata when transforming - transformed lacks source context
     metadata_source = preserve_metadata_from if preserve_metadata_from is not None else func
 
-    @functools.wraps(metadata_source)
-    def wrapper(*args: Any, **kwargs: Any) -> Any:
-      # Check guards if any are defined
-      if self.guards:
-        error_msg = GuardRuntime.check_guards(self.guards, args, kwargs)
-        if error_msg is not None:
-          # Handle failure
-          result, exception_to_raise = GuardRuntime.handle_failure(
-            error_msg, self.on_error, func.__name__, args, kwargs, self.log
-          )
-          # Exception path prioritized for clean error propagation
-          if exception_to_raise:
-            raise exception_to_raise
-          return result
-
-      # All guards passed - execute the function
-      return func(*args, **kwargs)
-
-    # Preserve signature for IDE autocomplete and runtime introspection
-    wrapper.__signature__ = inspect.signature(metadata_source)  # type: ignore[attr-defined]
-    wrapper.__annotations__ = getattr(metadata_source, '__annotations__', {})
+    guards = self.guards
+    if not guards:
+      # Nothing to check per call - hand back the function itself, no wrapper frame
+      return func if func is metadata_source else self._copy_metadata(func, metadata_source)
+
+    # Failure dispatch on on_error resolved once here rather than on every failing call
+    # Callables such as functools.partial have no __name__ - fall back to their repr for logs
+    func_name = getattr(func, '__name__', None) or repr(func)
+    on_failure = GuardRuntime.make_failure_handler(self.on_error, func_name, self.log)
+
+    # The pass/fail contract: a guard passes only by returning the True singleton (checked by
+    # identity, so truthy values fail). On failure a string result is the error message
+    def fail(guard_result: Any, args: Tuple[Any, ...], kwargs: dict[str, Any]) -> Any:
+      # Non-string failures (e.g. False) get the generic message
+      error_msg = (
+        guard_result if isinstance(guard_result, str) else ErrorMessages.GUARD_FAILED_GENERIC
+      )
+      # Raises the configured exception or returns the fallback value
+      return on_failure(error_msg, args, kwargs)
+
+    if len(guards) == 1:
+      # Single guard is the common case - call it directly, no tuple iteration
+      (guard,) = guards
+
+      def wrapper(*args: Any, **kwargs: Any) -> Any:
+        guard_result = guard(*args, **kwargs)
+        # Must be exact True, not just truthy
+        if guard_result is not True:
+          return fail(guard_result, args, kwargs)
+        return func(*args, **kwargs)
+
+    elif len(guards) == 2:
+      # Two guards unrolled - closure reads and no iterator, short-circuits on the first failure
+      first_guard, second_guard = guards
+
+      def wrapper(*args: Any, **kwargs: Any) -> Any:
+        guard_result = first_guard(*args, **kwargs)
+        if guard_result is not True:
+          return fail(guard_result, args, kwargs)
+        guard_result = second_guard(*args, **kwargs)
+        if guard_result is not True:
+          return fail(guard_result, args, kwargs)
+        return func(*args, **kwargs)
+
+    else:
+
+      def wrapper(*args: Any, **kwargs: Any) -> Any:
+        # Guard loop inlined - no extra call frame per invocation
+        for guard in guards:
+          guard_result = guard(*args, **kwargs)
+          # Early exit on first failure - must be exact True, not just truthy
+          if guard_result is not True:
+            return fail(guard_result, args, kwargs)
+
+        # All guards passed - execute the function
+        return func(*args, **kwargs)
+
+    return self._copy_metadata(wrapper, metadata_source)
+
+  @staticmethod
+  def _copy_metadata(wrapper: Callable[..., Any], source: Callable[..., Any]) -> Callable[..., Any]:
+    """Copy identifying metadata from source onto wrapper (a lean functools.wraps)."""
+    # Partials, builtins and callable instances lack some of these - skip what is missing,
+    # as functools.update_wrapper does
+    for attr in functools.WRAPPER_ASSIGNMENTS:
+      try:
+        value = getattr(source, attr)
+      except AttributeError:
+        continue
+      setattr(wrapper, attr, value)
+    # The wrapper's own (*args, **kwargs) annotations must not leak through
+    wrapper.__annotations__ = getattr(source, '__annotations__', {})
+    # Function attributes are rarely set - skip the dict merge when there are none
+    source_dict = getattr(source, '__dict__', None)
+    if source_dict:
+      wrapper.__dict__.update(source_dict)
+    # Signature resolves lazily through __wrapped__ - no inspect.signature cost per decoration
+    wrapper.__wrapped__ = source  # type: ignore[attr-defined]
     return wrapper
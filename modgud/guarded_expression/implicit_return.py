@@ -229,12 +229,16 @@ class ImplicitReturnTransformer:
     Raises:
         ExplicitReturnDisallowedError: If explicit return found
         MissingImplicitReturnError: If a block cannot yield a value
-        UnsupportedConstructError: If an unsupported construct is found
+        UnsupportedConstructError: If an unsupported construct is found, or the source
+            has no def named func_name (e.g. a lambda)
 
     """
     tree = ast.parse(func_source)
     transformer = _TopLevelTransformer(func_name, cls)
     new_tree = transformer.visit(tree)
+    if not transformer.matched:
+      # Lambdas and other non-def callables have no named definition to rewrite
+      raise UnsupportedConstructError(f"No function definition named '{func_name}' found in source")
     ast.fix_missing_locations(new_tree)
     return new_tree, f'<{func_name}-implicit>'
 
@@ -251,16 +255,19 @@ class _TopLevelTransformer(ast.NodeTransformer):
   def __init__(self, target_name: str, transformer_cls: type[ImplicitReturnTransformer]) -> None:
     self.target_name = target_name
     self.transformer_cls = transformer_cls
+    self.matched = False
     super().__init__()
 
   def visit_FunctionDef(self, node: ast.FunctionDef) -> ast.AST:
     if node.name == self.target_name:
+      self.matched = True
       node.decorator_list = []  # Strip decorators to prevent infinite recursion during exec
       return self.transformer_cls.transform_function_ast(node, node.name)
     return node
 
   def visit_AsyncFunctionDef(self, node: ast.AsyncFunctionDef) -> ast.AST:
     if node.name == self.target_name:
+      self.matched = True
       node.decorator_list = []  # Strip decorators to prevent infinite recursion during exec
       return self.transformer_cls.transform_function_ast(node, node.name)
     return node
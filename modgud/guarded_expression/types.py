@@ -1,10 +1,13 @@
 """Type definitions for the guarded_expression module."""
 
-from typing import Any, Callable, Union
+from typing import Any, Callable
 
 # Guard function signature: (*args, **kwargs) -> True | str
-GuardFunction = Callable[..., Union[bool, str]]
+GuardFunction = Callable[..., bool | str]
 
 # Failure behavior types
-FailureTypes = Union[bool, str, int, float, None, dict[str, Any], list[Any], tuple[Any, ...]]
-FailureBehavior = Union[FailureTypes, Callable[..., Any], type]
+FailureTypes = bool | str | int | float | None | dict[str, Any] | list[Any] | tuple[Any, ...]
+FailureBehavior = FailureTypes | Callable[..., Any] | type
+
+# Decoration-time specialized failure path: (error_msg, args, kwargs) -> fallback value, or raises
+FailureHandler = Callable[[str, tuple[Any, ...], dict[str, Any]], Any]
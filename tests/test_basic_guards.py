@@ -27,6 +27,16 @@ class TestBasicGuardExecution:
 
     assert_guard_fails(double, -5, expected_message='Must be positive')
 
+  def test_non_string_guard_failure_uses_generic_message(self):
+    """Falsy non-string guard results should fail with the generic message."""
+
+    @guarded_expression(lambda x: x > 0, implicit_return=False)
+    def double(x):
+      return x * 2
+
+    assert double(5) == 10
+    assert_guard_fails(double, -5, expected_message='Guard clause failed')
+
 
 class TestGuardFailureHandling:
   """Tests for different guard failure handling strategies."""
@@ -116,3 +126,27 @@ class TestMultipleGuards:
       return x * 2
 
     assert_guard_fails(double, 150, expected_message='Must be less than 100')
+
+  def test_multiple_guards_truthy_non_true_fails(self):
+    """Truthy results other than exact True should count as failures."""
+
+    @guarded_expression(lambda x: True, lambda x: 1, implicit_return=False)
+    def double(x):
+      return x * 2
+
+    assert_guard_fails(double, 5, expected_message='Guard clause failed')
+
+  def test_multiple_guards_third_fails(self):
+    """Guards beyond the second should still run in order."""
+
+    @guarded_expression(
+      lambda x: x > 0 or 'Must be positive',
+      lambda x: x < 100 or 'Must be less than 100',
+      lambda x: x % 2 == 0 or 'Must be even',
+      implicit_return=False,
+    )
+    def double(x):
+      return x * 2
+
+    assert double(50) == 100
+    assert_guard_fails(double, 51, expected_message='Must be even')
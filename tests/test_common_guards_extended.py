@@ -241,3 +241,35 @@ class TestCombinedGuards:
     # Valid URL but wrong pattern
     with pytest.raises(GuardClauseError, match='must match pattern'):
       call_api('https://example.com/api')
+
+
+class TestMakeGuardMessages:
+  """Tests for CommonGuards._make_guard message rendering."""
+
+  def test_static_template_message(self):
+    """Templates without {value} should render with the parameter name only."""
+    from modgud import CommonGuards
+
+    guard = CommonGuards._make_guard('amount', 0, lambda v: v > 0, '{param_name} must be positive')
+    assert guard(5) is True
+    assert guard(-1) == 'amount must be positive'
+
+  def test_value_template_message(self):
+    """Templates with {value} should render the failing value on every call."""
+    from modgud import CommonGuards
+
+    guard = CommonGuards._make_guard('size', 0, lambda v: v < 10, '{param_name} too big: {value!r}')
+    assert guard(3) is True
+    assert guard(12) == 'size too big: 12'
+    assert guard(size=99) == 'size too big: 99'
+
+  def test_value_field_path_template_message(self):
+    """Templates reaching into {value} by attribute or index should render per call."""
+    from modgud import CommonGuards
+
+    guard = CommonGuards._make_guard('n', 0, lambda v: v > 0, '{param_name} bad: {value.real}')
+    assert guard(-1) == 'n bad: -1'
+    guard = CommonGuards._make_guard(
+      'xs', 0, lambda v: len(v) < 2, '{param_name} starts {value[0]}'
+    )
+    assert guard([7, 8]) == 'xs starts 7'
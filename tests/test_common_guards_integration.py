@@ -109,3 +109,32 @@ class TestGuardParameterHandling:
     with pytest.raises(GuardClauseError) as exc_info:
       process(None)  # None is falsy, so fails not_empty check
     assert 'empty' in str(exc_info.value)
+
+
+class TestPackageGuardExports:
+  """Tests for the module-level guard exports."""
+
+  def test_guard_exports_match_common_guards(self):
+    """Top-level guard exports should resolve to the CommonGuards factories."""
+    import modgud
+
+    for name in modgud.__all__:
+      assert getattr(modgud, name) is not None
+    assert modgud.positive is modgud.CommonGuards.positive
+
+  def test_guard_exports_match_common_guard_names(self):
+    """Every common guard name should be exported at top level, bound to its factory."""
+    import modgud
+    from modgud.guarded_expression.common_guards import COMMON_GUARD_NAMES
+
+    assert set(COMMON_GUARD_NAMES) <= set(modgud.__all__)
+    guard_exports = [name for name in modgud.__all__ if hasattr(modgud.CommonGuards, name)]
+    assert guard_exports == list(COMMON_GUARD_NAMES)
+    for name in COMMON_GUARD_NAMES:
+      assert getattr(modgud, name) is getattr(modgud.CommonGuards, name)
+
+  def test_dir_lists_all_exports(self):
+    """dir() should list every name in __all__."""
+    import modgud
+
+    assert set(modgud.__all__) <= set(dir(modgud))
@@ -70,6 +70,46 @@ class TestGuardRegistry:
     assert result is True
     assert not registry._has_guard('guard1')
 
+  def test_namespace_listing_follows_registrations(self):
+    """Namespaces should be listed while they hold guards and dropped once emptied."""
+    registry = GuardRegistry._create_for_testing()
+
+    def guard():
+      pass
+
+    registry._register('shared', guard)
+    registry._register('shared', guard, namespace='ns_a')
+    registry._register('other', guard, namespace='ns_b')
+
+    assert registry._list_guards() == ['shared']
+    assert registry._list_guards(namespace='ns_a') == ['shared']
+    assert registry._list_namespaces() == ['ns_a', 'ns_b']
+
+    assert registry._unregister('shared', namespace='ns_a') is True
+    assert registry._unregister('shared', namespace='ns_a') is False
+    assert registry._list_namespaces() == ['ns_b']
+    assert registry._has_guard('shared')
+
+  def test_namespace_order_survives_partial_unregister(self):
+    """A namespace keeps its creation position while it still holds guards."""
+    registry = GuardRegistry._create_for_testing()
+
+    def guard():
+      pass
+
+    registry._register('a', guard, namespace='ns1')
+    registry._register('b', guard, namespace='ns2')
+    registry._register('c', guard, namespace='ns1')
+    assert registry._unregister('a', namespace='ns1') is True
+    assert registry._list_namespaces() == ['ns1', 'ns2']
+
+  def test_singleton_enforced(self):
+    """The singleton should exist at import and block direct instantiation."""
+    assert GuardRegistry.instance() is GuardRegistry.instance()
+
+    with pytest.raises(RuntimeError, match='singleton'):
+      GuardRegistry()
+
 
 class TestGlobalRegistryFunctions:
   """Tests for global registry convenience functions."""
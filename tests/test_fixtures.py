@@ -5,6 +5,8 @@ These functions are defined at module level so their source can be inspected
 by the implicit_return transformer.
 """
 
+import functools
+
 from modgud import not_none, positive
 from modgud.guarded_expression import guarded_expression
 from modgud.guarded_expression.errors import GuardClauseError
@@ -148,3 +150,75 @@ def conditional_noop(x):
     pass
   else:
     None
+
+
+# Undecorated function - decorated inside tests to exercise repeated decoration
+def plain_triple(x):
+  x * 3
+
+
+# Forward reference - helper is defined after the decorated function
+@guarded_expression(implicit_return=True)
+def uses_later_helper(x):
+  later_helper(x) * 2
+
+
+def later_helper(x):
+  return x + 1
+
+
+# PEP 695 generic function - its code is nested inside a type-parameter scope
+@guarded_expression(implicit_return=True)
+def first_item[T](items: list[T]) -> T:
+  items[0]
+
+
+# Mutable default - transformed function should share the original default object
+@guarded_expression(implicit_return=True)
+def scale_with_default(x, factor=[2], *, offset=0):  # noqa: B006
+  x * factor[0] + offset
+
+
+# Recursive function - the recording guard shows which calls go through the guarded wrapper
+factorial_guard_calls = []
+
+
+def _record_factorial_arg(n):
+  factorial_guard_calls.append(n)
+  return n >= 1 or 'n must be at least 1'
+
+
+@guarded_expression(_record_factorial_arg, implicit_return=True)
+def guarded_factorial(n):
+  if n == 1:
+    1
+  else:
+    n * guarded_factorial(n - 1)
+
+
+# Shared wraps-style decorator - every function it wraps has the same wrapper code object
+def passthrough(func):
+  @functools.wraps(func)
+  def wrapper(*args, **kwargs):
+    return func(*args, **kwargs)
+
+  return wrapper
+
+
+@guarded_expression(positive('x'))
+@passthrough
+def add_one(x):
+  x + 1
+
+
+@guarded_expression(positive('x'))
+@passthrough
+def times_thousand(x):
+  x * 1000
+
+
+# Defaults live on the wrapped function - the passthrough wrapper has none
+@guarded_expression(positive('x'))
+@passthrough
+def scaled(x, scale=3):
+  x * scale
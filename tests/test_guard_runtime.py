@@ -1,115 +1,63 @@
 """Unit tests for guard runtime logic."""
 
+import pytest
 from modgud.guarded_expression.errors import GuardClauseError
 from modgud.guarded_expression.guard_runtime import GuardRuntime
 
 
-class TestCheckGuards:
-  """Tests for guard validation logic."""
-
-  def test_check_guards_all_pass(self):
-    """Test that check_guards returns None when all guards pass."""
-    guards = (
-      lambda x: x > 0 or 'Must be positive',
-      lambda x: x < 100 or 'Must be less than 100',
-    )
-    result = GuardRuntime.check_guards(guards, (50,), {})
-    assert result is None
-
-  def test_check_guards_first_fails(self):
-    """Test that check_guards returns error message from first failed guard."""
-    guards = (
-      lambda x: x > 0 or 'Must be positive',
-      lambda x: x < 100 or 'Must be less than 100',
-    )
-    result = GuardRuntime.check_guards(guards, (-5,), {})
-    assert result == 'Must be positive'
-
-  def test_check_guards_second_fails(self):
-    """Test that check_guards returns error message from second failed guard."""
-    guards = (
-      lambda x: x > 0 or 'Must be positive',
-      lambda x: x < 100 or 'Must be less than 100',
-    )
-    result = GuardRuntime.check_guards(guards, (150,), {})
-    assert result == 'Must be less than 100'
-
-  def test_check_guards_boolean_false(self):
-    """Test that check_guards handles boolean False guard result."""
-    guards = (lambda x: False,)
-    result = GuardRuntime.check_guards(guards, (5,), {})
-    assert result == 'Guard clause failed'
-
-
-class TestHandleFailure:
-  """Tests for guard failure handling strategies."""
-
-  def test_handle_failure_exception_class(self):
-    """Test handle_failure with exception class."""
-    result, exception = GuardRuntime.handle_failure(
-      'Test error', ValueError, 'test_func', (1, 2), {}, False
-    )
-    assert result is None
-    assert isinstance(exception, ValueError)
-    assert str(exception) == 'Test error'
-
-  def test_handle_failure_custom_value(self):
-    """Test handle_failure with custom return value."""
-    result, exception = GuardRuntime.handle_failure(
-      'Test error', {'error': 'custom'}, 'test_func', (1, 2), {}, False
-    )
-    assert result == {'error': 'custom'}
-    assert exception is None
-
-  def test_handle_failure_callable(self):
-    """Test handle_failure with callable handler."""
-
-    def handler(msg, *args, **kwargs):
-      return f'Handled: {msg}'
-
-    result, exception = GuardRuntime.handle_failure(
-      'Test error', handler, 'test_func', (1, 2), {}, False
-    )
-    assert result == 'Handled: Test error'
-    assert exception is None
-
-  def test_handle_failure_guard_clause_error(self):
-    """Test handle_failure with GuardClauseError."""
-    result, exception = GuardRuntime.handle_failure(
-      'Test error', GuardClauseError, 'test_func', (1, 2), {}, False
-    )
-    assert result is None
-    assert isinstance(exception, GuardClauseError)
-    assert str(exception) == 'Test error'
-
-  def test_handle_failure_none_value(self):
-    """Test handle_failure with None as on_error value."""
-    result, exception = GuardRuntime.handle_failure(
-      'Test error', None, 'test_func', (1, 2), {}, False
-    )
-    assert result is None
-    assert exception is None
-
-  def test_handle_failure_with_logging(self, caplog):
-    """Test handle_failure logs when log=True."""
+class TestMakeFailureHandler:
+  """Tests for decoration-time specialized failure handlers."""
+
+  def test_exception_class_handler_raises(self):
+    """Handler built from an exception class should raise it with the message."""
+    handler = GuardRuntime.make_failure_handler(ValueError, 'test_func', False)
+    with pytest.raises(ValueError, match='Test error'):
+      handler('Test error', (1, 2), {})
+
+  def test_callable_handler_receives_arguments(self):
+    """Handler built from a callable should forward the message and call arguments."""
+
+    def recover(msg, *args, **kwargs):
+      return (msg, args, kwargs)
+
+    handler = GuardRuntime.make_failure_handler(recover, 'test_func', False)
+    assert handler('Test error', (1, 2), {'k': 3}) == ('Test error', (1, 2), {'k': 3})
+
+  def test_guard_clause_error_handler_raises(self):
+    """Handler built from GuardClauseError should raise it with the message."""
+    handler = GuardRuntime.make_failure_handler(GuardClauseError, 'test_func', False)
+    with pytest.raises(GuardClauseError, match='Test error'):
+      handler('Test error', (1, 2), {})
+
+  def test_none_value_handler_returns_none(self):
+    """None as on_error should be returned as the fallback, not treated as a handler."""
+    handler = GuardRuntime.make_failure_handler(None, 'test_func', False)
+    assert handler('Test error', (1, 2), {}) is None
+
+  def test_value_handler_returns_value(self):
+    """Handler built from a plain value should return it unchanged."""
+    handler = GuardRuntime.make_failure_handler({'error': 'custom'}, 'test_func', False)
+    assert handler('Test error', (1,), {}) == {'error': 'custom'}
+
+  def test_handler_logs_when_enabled(self, caplog):
+    """Handler should log the failure when logging is enabled."""
     import logging
 
     caplog.set_level(logging.INFO)
+    handler = GuardRuntime.make_failure_handler(None, 'process_user', True)
 
-    result, exception = GuardRuntime.handle_failure(
-      'Validation failed',
-      None,
-      'process_user',
-      (1, 2),
-      {'name': 'test'},
-      True,  # log_enabled=True
-    )
-
-    # Verify logging occurred
+    assert handler('Validation failed', (), {}) is None
     assert len(caplog.records) == 1
     assert 'Guard clause failed in process_user: Validation failed' in caplog.text
     assert caplog.records[0].levelname == 'INFO'
 
-    # Verify normal behavior
-    assert result is None
-    assert exception is None
+  def test_handler_logs_before_raising(self, caplog):
+    """Failures should be logged even when the handler raises."""
+    import logging
+
+    caplog.set_level(logging.INFO)
+    handler = GuardRuntime.make_failure_handler(ValueError, 'process_user', True)
+
+    with pytest.raises(ValueError):
+      handler('Validation failed', (), {})
+    assert 'Guard clause failed in process_user: Validation failed' in caplog.text
@@ -1,8 +1,14 @@
 """Tests for implicit return functionality."""
 
+import importlib
+
 import pytest
 from modgud.guarded_expression import guarded_expression
-from modgud.guarded_expression.errors import ExplicitReturnDisallowedError, GuardClauseError
+from modgud.guarded_expression.errors import (
+  ExplicitReturnDisallowedError,
+  GuardClauseError,
+  UnsupportedConstructError,
+)
 
 from tests.helpers import assert_guard_fails
 
@@ -31,6 +37,20 @@ class TestImplicitReturnBasics:
     assert safe_divide(10, 2) == 5.0
     assert safe_divide(10, 0) == 0
 
+  def test_implicit_return_sees_later_module_globals(self):
+    """Transformed functions should resolve module names defined after decoration."""
+    from tests import test_fixtures
+    from tests.test_fixtures import uses_later_helper
+
+    assert uses_later_helper(1) == 4
+    # No guards, so this is the transformed function itself - bound to the real module dict
+    assert uses_later_helper.__globals__ is vars(test_fixtures)
+
+  def test_implicit_return_rejects_lambda(self):
+    """Lambdas have no def to rewrite - never pick up another lambda from the same line."""
+    with pytest.raises(UnsupportedConstructError):
+      guarded_expression(lambda x: x > 0 or 'neg')(lambda x: x * 2)
+
   def test_implicit_return_disallows_explicit_return(self):
     """Explicit return should raise error when implicit_return=True."""
     with pytest.raises(ExplicitReturnDisallowedError):
@@ -59,3 +79,99 @@ class TestImplicitReturnWithGuards:
 
     with pytest.raises(GuardClauseError):
       double_with_guards(-5)
+
+  def test_recursive_calls_go_through_guards(self):
+    """Recursive calls resolve to the guarded function, so guards run on every level."""
+    from tests.test_fixtures import factorial_guard_calls, guarded_factorial
+
+    factorial_guard_calls.clear()
+    assert guarded_factorial(4) == 24
+    assert factorial_guard_calls == [4, 3, 2, 1]
+
+
+class TestImplicitReturnCaching:
+  """Tests for reuse of compiled implicit-return transformations."""
+
+  def test_repeated_decoration_reuses_transform(self, monkeypatch):
+    """Decorating the same function twice should only extract source once."""
+    from tests.test_fixtures import plain_triple
+
+    module = importlib.import_module('modgud.guarded_expression.guarded_expression')
+
+    calls = []
+    original_getsource = module.inspect.getsource
+
+    def counting_getsource(obj):
+      calls.append(obj)
+      return original_getsource(obj)
+
+    monkeypatch.setattr(module.guarded_expression, '_transform_cache', {})
+    monkeypatch.setattr(module.inspect, 'getsource', counting_getsource)
+
+    first = guarded_expression()(plain_triple)
+    second = guarded_expression(lambda x: x > 0 or 'Must be positive')(plain_triple)
+
+    assert first(2) == 6
+    assert second(3) == 9
+    assert len(calls) == 1
+    assert_guard_fails(second, -1, expected_message='Must be positive')
+
+  def test_identical_source_reuses_compile(self, monkeypatch):
+    """A new code object with unchanged source (e.g. after reload) should skip recompiling."""
+    from modgud.guarded_expression.implicit_return import ImplicitReturnTransformer
+
+    from tests.test_fixtures import plain_triple
+
+    module = importlib.import_module('modgud.guarded_expression.guarded_expression')
+    calls = []
+    original_transform = ImplicitReturnTransformer.apply_implicit_return_transform
+
+    def counting_transform(source, func_name):
+      calls.append(func_name)
+      return original_transform(source, func_name)
+
+    module.guarded_expression._compile_source.cache_clear()
+    monkeypatch.setattr(
+      module.ImplicitReturnTransformer, 'apply_implicit_return_transform', counting_transform
+    )
+    for _ in range(2):
+      # Fresh code-object cache each round, as after importlib.reload()
+      monkeypatch.setattr(module.guarded_expression, '_transform_cache', {})
+      assert guarded_expression()(plain_triple)(2) == 6
+
+    assert calls == ['plain_triple']
+
+  def test_shared_wraps_decorator_keeps_bodies_apart(self):
+    """Functions wrapped by one wraps-style decorator share wrapper code, not a transform."""
+    from tests.test_fixtures import add_one, times_thousand
+
+    assert add_one(1) == 2
+    assert times_thousand(1) == 1000
+
+
+class TestImplicitReturnFunctionConstruction:
+  """Tests for how the transformed function object is built."""
+
+  def test_defaults_shared_with_original(self):
+    """Positional and keyword-only defaults should be the original objects."""
+    from tests.test_fixtures import scale_with_default
+
+    original = scale_with_default.__wrapped__
+    assert scale_with_default(3) == 6
+    assert scale_with_default(3, offset=1) == 7
+    assert scale_with_default.__defaults__[0] is original.__defaults__[0]
+    assert scale_with_default.__kwdefaults__ == {'offset': 0}
+
+  def test_generic_function(self):
+    """PEP 695 generic functions should transform and keep their type parameters."""
+    from tests.test_fixtures import first_item
+
+    assert first_item([3, 4]) == 3
+    assert [t.__name__ for t in first_item.__type_params__] == ['T']
+
+  def test_defaults_taken_from_wrapped_function(self):
+    """Functions under a wraps-style decorator should keep the inner def's defaults."""
+    from tests.test_fixtures import scaled
+
+    assert scaled(2) == 6
+    assert scaled(2, scale=5) == 10
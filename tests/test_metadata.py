@@ -1,9 +1,13 @@
 """Tests for metadata preservation and edge cases."""
 
+import inspect
+
 import pytest
 from modgud.guarded_expression import guarded_expression
 from modgud.guarded_expression.errors import GuardClauseError, UnsupportedConstructError
 
+from tests.helpers import assert_guard_fails
+
 
 class TestMetadataPreservation:
   """Tests for function metadata preservation through decoration."""
@@ -20,6 +24,51 @@ class TestMetadataPreservation:
     assert documented_function.__doc__ == 'Multiply input by two.'
     assert documented_function.__annotations__ == {'x': int, 'return': int}
 
+  def test_wrapper_metadata_copied(self):
+    """Qualified name, module, function attributes and __wrapped__ should carry over."""
+
+    def tagged(x):
+      return x
+
+    tagged.tag = 'marker'
+    decorated = guarded_expression(lambda x: True, implicit_return=False)(tagged)
+
+    assert decorated.__qualname__ == tagged.__qualname__
+    assert decorated.__module__ == tagged.__module__
+    assert decorated.tag == 'marker'
+    assert decorated.__wrapped__ is tagged
+
+  def test_non_function_callables(self):
+    """Partials, builtins and callable instances should decorate without their missing metadata."""
+    import functools
+    import operator
+
+    class Doubler:
+      def __call__(self, x):
+        return x * 2
+
+    positive = lambda x: x > 0 or 'Must be positive'  # noqa: E731
+    triple = guarded_expression(positive, implicit_return=False)(functools.partial(operator.mul, 3))
+    absolute = guarded_expression(positive, implicit_return=False)(abs)
+    doubler = guarded_expression(positive, implicit_return=False)(Doubler())
+
+    assert triple(2) == 6
+    assert absolute(4) == 4
+    assert absolute.__name__ == 'abs'
+    assert doubler(5) == 10
+    assert_guard_fails(triple, -1, expected_message='Must be positive')
+
+  def test_signature_preserved(self):
+    """inspect.signature should report the original parameters after decoration."""
+    from tests.test_fixtures import simple_implicit
+
+    def scale(x: int, factor: int = 2) -> int:
+      return x * factor
+
+    decorated = guarded_expression(implicit_return=False)(scale)
+    assert inspect.signature(decorated) == inspect.signature(scale)
+    assert list(inspect.signature(simple_implicit).parameters) == ['x']
+
 
 class TestDecoratorWithoutGuards:
   """Tests for decorator behavior when no guards are provided."""
@@ -33,11 +82,22 @@ class TestDecoratorWithoutGuards:
 
     assert simple(5) == 10
 
+  def test_no_guards_returns_function_unwrapped(self):
+    """Without guards or transformation the decorator should add no wrapper layer."""
+
+    def simple(x):
+      return x * 2
+
+    assert guarded_expression(implicit_return=False)(simple) is simple
+
   def test_no_guards_implicit_return_true(self):
     """Decorator should work with no guards and implicit_return=True."""
     from tests.test_fixtures import simple_implicit
 
     assert simple_implicit(5) == 10
+    assert simple_implicit.__name__ == 'simple_implicit'
+    # The transformed function is returned directly rather than wrapped again
+    assert simple_implicit.__code__.co_filename == '<simple_implicit-implicit>'
 
 
 class TestDecoratorEdgeCases: